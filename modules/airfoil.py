@@ -10,9 +10,11 @@ import logging
 
 import os
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import numpy as np
-from math_util import * 
-from common_utils import * 
+from common_utils import ErrorMsg, WarningMsg, fromDict, toDict
 from airfoil_geometry import Geometry_Splined, Geometry, Geometry_Bezier, Geometry_HicksHenne
 from airfoil_geometry import Side_Airfoil, Side_Airfoil_Bezier, UPPER, LOWER
 
@@ -34,6 +36,21 @@ FINAL       = "Final"
 
 AIRFOIL_TYPES = [NORMAL, SEED, SEED_DESIGN, REF1, REF2, DESIGN, FINAL]
 
+# already parsed .dat files - key absolute path, value (mtime, size, name, x, y)
+#    so the same airfoil file used in several places is read only once
+#    least recently used entries are dropped beyond LOADED_FILES_MAX 
+
+#    access only with _loaded_files_lock - load_many reads in parallel threads 
+
+LOADED_FILES_MAX   = 32
+_loaded_files      = OrderedDict()
+_loaded_files_lock = threading.Lock()
+
+
+def _loaded_files_key (pathFile : str) -> str:
+    """ key of pathFile in _loaded_files - the same file gives the same key"""
+    return os.path.normcase (os.path.abspath (pathFile))
+
 
 #--------------------------------------------------------------------------
 
@@ -78,10 +95,10 @@ class Airfoil:
         self._name        = name if name is not None else ''
         self.sourceName   = None                 # long name out of the two blended airfoils (TSrakAirfoil)
 
+        self._xy    = None                       # x,y in one (2,n) buffer - _x, _y are its rows
         if not x is None: x = x if isinstance(x,np.ndarray) else np.asarray (x)
-        self._x     = x
         if not y is None: y = y if isinstance(y,np.ndarray) else np.asarray (y)
-        self._y     = y  
+        self._set_xy_buffer (x, y)
 
         self._isModified     = False
         self._isEdited       = False 
@@ -182,6 +199,26 @@ class Airfoil:
             raise ValueError (f"Unknown file extension '{ext}' for new airfoil")
 
 
+    @classmethod
+    def load_many (cls, pathFileNames : list, workingDir = None) -> list:
+        """
+        Alternate constructor for a list of new, loaded Airfoils.
+        The files are read in parallel threads so file io of the airfoils overlaps 
+
+        Args:
+            pathFileNames: list of existinng airfoil path and names
+            workingDir: optional working dir (if paths are relative)
+        """
+
+        airfoils = [cls (pathFileName = pathFileName, workingDir = workingDir) 
+                        for pathFileName in pathFileNames]
+
+        with ThreadPoolExecutor (max_workers=8) as executor:
+            list (executor.map (lambda airfoil: airfoil.load(), airfoils))   # list - get exceptions
+
+        return airfoils
+
+
 
     def _save (self, airfoilDict):
         """ stores the variables into the dataDict - returns the filled dict"""
@@ -232,13 +269,16 @@ class Airfoil:
 
         if not x is None: 
             x = x if isinstance(x,np.ndarray) else np.asarray (x)
-            x = np.round(x,7)
         if not y is None: 
             y = y if isinstance(y,np.ndarray) else np.asarray (y)
-            y = np.round(y,7)
 
-        self._x     = x
-        self._y     = y  
+        self._set_xy_buffer (x, y)
+
+        if self._xy is not None: 
+            np.round (self._xy, 7, out=self._xy)            # both rows at once 
+        else: 
+            if not self._x is None: self._x = np.round(self._x,7)
+            if not self._y is None: self._y = np.round(self._y,7)
 
         self._geo    = None
 
@@ -257,8 +297,8 @@ class Airfoil:
     @property
     def name_short (self):
         """ name of airfoil shortend at the beginning to 23 chars"""
-        if len(self.name) <= 23:    return self.name
-        else:                       return "..." + self.name[-20:]
+        name = self.name
+        return name if len(name) <= 23 else "..." + name[-20:]
             
     @property
     def hasPolarSets (self):
@@ -300,7 +340,7 @@ class Airfoil:
 
     @property
     def isLoaded (self):
-        return self._x is not None and len(self._x) > 10
+        return self._nPoints_xy > 10
     
     @property
     def isNormalized (self):
@@ -405,8 +445,7 @@ class Airfoil:
 
         self.geo._rebuild_from_thicknessCamber ()        # new build of x,y in geo
 
-        self._x = self.geo.x
-        self._y = self.geo.y
+        self._set_xy_buffer (self.geo.x, self.geo.y)
 
         self.geo.set_xy_org (self._x, self._y)          # update the copy of x,y in geo 
 
@@ -491,15 +530,28 @@ class Airfoil:
         else:
             ErrorMsg ("Airfoil \'%s\' does not exist. Couldn\'t be set" % fullPath)
 
+    @property
+    def pathFileName (self):
+        """
+        path and filename of airfoil like '..\\myAirfoils\\JX-GT-15.dat'
+        """
+        return self._pathFileName
+
+    @pathFileName.setter
+    def pathFileName (self, aPathFileName):
+        self._pathFileName = aPathFileName
+        # cache filename - it's asked often e.g. by the ui 
+        if aPathFileName is not None: 
+            self._fileName = os.path.basename (aPathFileName)
+        else: 
+            self._fileName = None
+
     @property
     def fileName (self):
         """
         filename of airfoil like 'JX-GT-15.dat'
         """
-        if not self.pathFileName is None: 
-            return os.path.basename(self.pathFileName) 
-        else:
-            return None
+        return self._fileName
 
     @property
     def pathName (self):
@@ -527,40 +579,95 @@ class Airfoil:
             sourcePathFile = None 
 
         if sourcePathFile:
-            f = open(sourcePathFile, 'r')
-            file_lines = f.readlines()
-            f.close()
-            self._name, self._x, self._y = self._loadLines(file_lines)
+            absPathFile = _loaded_files_key (sourcePathFile)
+            stat = os.stat (absPathFile)
+
+            with _loaded_files_lock:
+                cached = _loaded_files.get (absPathFile)
+                if cached is not None and cached[0:2] == (stat.st_mtime_ns, stat.st_size):
+                    _loaded_files.move_to_end (absPathFile)
+                else: 
+                    cached = None
+
+            if cached is None:
+                # read and parse outside the lock - so threads of load_many overlap 
+                with open(sourcePathFile, 'r') as f:
+                    file_lines = f.readlines()
+                name, x, y = self._loadLines(file_lines)
+                cached = (stat.st_mtime_ns, stat.st_size, name, x, y)
+
+                with _loaded_files_lock:
+                    _loaded_files[absPathFile] = cached
+                    _loaded_files.move_to_end (absPathFile)
+                    if len(_loaded_files) > LOADED_FILES_MAX:
+                        _loaded_files.popitem (last=False)
+
+            # hand out copies - cached arrays must not be shared between airfoils
+            self._name = cached[2]
+            self._set_xy_buffer (cached[3], cached[4])
+
+
+    def _set_xy_buffer (self, x : np.ndarray, y : np.ndarray):
+        """ 
+        copies x,y into a new contiguous (2,n) array self._xy - self._x, self._y are 
+        the row views of it. Falls back to plain x,y if they can't be stacked
+        """
+
+        if x is None or y is None or len(x) != len(y): 
+            self._xy = None
+            self._x  = x
+            self._y  = y
+        else: 
+            self._xy = np.empty ((2, len(x)), dtype=np.float64)
+            self._xy[0] = x
+            self._xy[1] = y
+            self._x  = self._xy[0]
+            self._y  = self._xy[1]
+
+        self._nPoints_xy = 0 if self._x is None else len(self._x)
 
 
     def _loadLines (self, file_lines):
 
-        # returns the name and x,y (np array) of the airfoil file 
-
-        x = []
-        y = []
-        xvalPrev = -9999.9
-        yvalPrev = -9999.9
-
-        for i, line in enumerate(file_lines):
-            if (i > 0): 
-                splitline = line.strip().split()               # will remove all extra spaces
-                if len(splitline) == 1:                        # couldn't split line - try tab as separator
-                    splitline = line.strip().split("\t",1)
-                if len(splitline) >= 2:                     
-                    xval = float(splitline[0].strip())
-                    yval = float(splitline[1].strip())
-                    if xval == xvalPrev and yval == yvalPrev:   # avoid duplicate, dirty coordinates
-                        WarningMsg ("Airfoil '%s' has duplicate coordinates - skipped." % self._name)
-                    else: 
-                        x.append (xval)
-                        y.append (yval) 
-                    xvalPrev = xval 
-                    yvalPrev = yval 
-            else: 
-                name = line.strip()
+        # returns the name and x,y (np array) of the airfoil file
+
+        name = file_lines[0].strip()
+
+        # fast path - let numpy parse the coordinate lines
+        try:
+            x, y = np.loadtxt (file_lines[1:], usecols=(0,1), ndmin=2, unpack=True)
+        except ValueError:
+            x, y = self._parseLines_python (file_lines[1:]).T
+
+        # x,y are views - no copy needed as airfoil copies them into its own buffer
+
+        # avoid duplicate, dirty coordinates
+        isDuplicate = (np.diff(x) == 0.0) & (np.diff(y) == 0.0)
+        nDuplicates = np.count_nonzero (isDuplicate)
+        if nDuplicates:
+            WarningMsg ("Airfoil '%s' has %d duplicate coordinates - skipped." % (self._name, nDuplicates))
+            keep = np.concatenate (([True], ~isDuplicate))
+            x, y = x[keep], y[keep]
+
+        return name, x, y
+
+
+    def _parseLines_python (self, coord_lines) -> np.ndarray:
+
+        # returns the (n,2) array of the coordinate lines 
+        #    line by line split for files numpy can't handle (e.g. mixed separators)
+        #    the conversion to float is done at once by numpy 
+
+        xy_str = []
 
-        return name, np.asarray (x), np.asarray (y)
+        for line in coord_lines:
+            splitline = line.split()                       # will remove all extra spaces
+            if len(splitline) == 1:                        # couldn't split line - try tab as separator
+                splitline = line.strip().split("\t",1)
+            if len(splitline) >= 2:                     
+                xy_str.append (splitline[:2])
+
+        return np.array (xy_str, dtype=np.float64).reshape (-1,2)
 
 
     def save (self):
@@ -663,28 +770,44 @@ class Airfoil:
             nameExt: -optional     - will be appended to self.name (if name is not provided)
             geometry: optional     - the geometry staretegy either GEO_BASIC, GEO_SPLNE...
         """
-        if pathFileName is None and name is None: 
-            pathFileName = self.pathFileName
-
-        if name is None:
-            name = self.name + nameExt if nameExt else self.name
+        pathFileName, name = self._copy_pathFileName_name (pathFileName, name, nameExt)
 
         geometry = geometry if geometry else self._geometryClass
 
-        airfoil =  Airfoil (x = np.copy (self.x), y = np.copy (self.y), 
+        # new airfoil copies x,y into its own buffer 
+        airfoil =  Airfoil (x = self.x, y = self.y, 
                             name = name, pathFileName = pathFileName, 
                             geometry = geometry )
         return airfoil 
 
 
+    def _copy_pathFileName_name (self, pathFileName, name, nameExt) -> tuple:
+        """ returns pathFileName and name for a copy of self - see asCopy"""
+
+        if pathFileName is None and name is None: 
+            pathFileName = self.pathFileName
+
+        if name is None:
+            name = self.name + nameExt if nameExt else self.name
+
+        return pathFileName, name
+
+
     def _write_to_file (self):
         """ writes .dat file of to self.pathFileName"""
 
-        with open(self.pathFileName, 'w+') as file:
+        # the written file and the file self is loaded from (relative to workingDir)
+        with _loaded_files_lock:
+            for pathFile in (self.pathFileName, os.path.join (self.workingDir, self.pathFileName)):
+                _loaded_files.pop (_loaded_files_key (pathFile), None)
+
+        with open(self.pathFileName, 'w', buffering=65536) as file:
             file.write("%s\n" % self.name)
-            for i in range (len(self.x)):
-                file.write("%.7f %.7f\n" %(self.x[i], self.y[i]))
-            file.close()
+            if self._xy is not None:
+                xy = self._xy.T                             # view - no new array needed 
+            else:
+                xy = np.column_stack ((self.x, self.y))
+            np.savetxt (file, xy, fmt="%.7f %.7f")
 
 
     def repanel (self): 
@@ -903,30 +1026,29 @@ class Airfoil_Bezier(Airfoil):
         new_name = 'Bezier_Airfoil'                         # defalut name 
 
         try: 
-            px, py = [], []
-            for i, line in enumerate(file_lines):
-                if i == 0:
-                    new_name = line.strip()
-                else: 
-                    line = line.lower()
-                    if "start" in line:
-                        if "top" in line: 
-                            curveType = UPPER
-                        else:
-                            curveType = LOWER 
-                        px, py = [], []
-                    elif "end" in line:
-                        if not px : raise ValueError("Start line missing")
-                        if "top"    in line and curveType == LOWER: raise ValueError ("Missing 'Bottom End'")  
-                        if "bottom" in line and curveType == UPPER: raise ValueError ("Missing 'Bottom Top'") 
-                        self.set_newSide_for (curveType, px,py)
-                    else:     
-                        splitline = line.strip().split()
-                        if len(splitline) == 1:                        # couldn't split line - try tab as separator
-                            splitline = line.strip().split("\t")
-                        if len(splitline) >= 2:                     
-                            px.append (float(splitline[0].strip()))
-                            py.append (float(splitline[1].strip()))
+            if file_lines: 
+                new_name = file_lines[0].strip()
+
+            # only the keyword lines are scanned - the points between are parsed by numpy  
+            iStart = None
+            for i, line in enumerate(file_lines[1:], start=1):
+                line = line.lower()
+                if "start" in line:
+                    if "top" in line: 
+                        curveType = UPPER
+                    else:
+                        curveType = LOWER 
+                    iStart = i
+                elif "end" in line:
+                    if iStart is None : raise ValueError("Start line missing")
+                    if "top"    in line and curveType == LOWER: raise ValueError ("Missing 'Bottom End'")  
+                    if "bottom" in line and curveType == UPPER: raise ValueError ("Missing 'Bottom Top'") 
+                    # like before stray lines with less than 2 values are skipped 
+                    point_lines = [l for l in file_lines[iStart+1:i] if len(l.split()) >= 2]
+                    if not point_lines: raise ValueError("Start line missing")
+                    px, py = np.loadtxt (point_lines, usecols=(0,1), ndmin=2, unpack=True)
+                    self.set_newSide_for (curveType, px,py)
+                    iStart = None
         except ValueError as e:
             ErrorMsg ("While reading Bezier file '%s': %s " %(fromPath,e )) 
             return 0 
@@ -949,23 +1071,19 @@ class Airfoil_Bezier(Airfoil):
         #  .bez-format for CAD etc and 
 
         # filename - remove .dat - add .bez 
-        with open(self.pathFileName_bezier, 'w+') as file:
+        with open(self.pathFileName_bezier, 'w', buffering=65536) as file:
 
             # airfoil name 
             file.write("%s\n" % self.name)
 
             file.write("Top Start\n" )
-            for p in self.geo.upper.controlPoints:
-                file.write("%13.10f %13.10f\n" %(p[0], p[1]))
+            np.savetxt (file, self.geo.upper.controlPoints, fmt="%13.10f %13.10f")
             file.write("Top End\n" )
 
             file.write("Bottom Start\n" )
-            for p in self.geo.lower.controlPoints:
-                file.write("%13.10f %13.10f\n" %(p[0], p[1]))
+            np.savetxt (file, self.geo.lower.controlPoints, fmt="%13.10f %13.10f")
             file.write("Bottom End\n" )
 
-            file.close()
-
 
     def asCopy (self, pathFileName = None, 
                 name=None, nameExt=None,
@@ -981,11 +1099,7 @@ class Airfoil_Bezier(Airfoil):
         """
         # overloaded as Bezier needs a special copy, no other geometry supported
 
-        if pathFileName is None and name is None: 
-            pathFileName = self.pathFileName
-
-        if name is None:
-            name = self.name + nameExt if nameExt else self.name
+        pathFileName, name = self._copy_pathFileName_name (pathFileName, name, nameExt)
 
         if geometry is not None: 
             raise ValueError ("Airfoil_Bezier does not support new geometry class")
@@ -9,6 +9,7 @@ The "Artists" to plot a airfoil object on a matplotlib axes
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
+from matplotlib.collections import LineCollection
 
 from artist             import *
 from common_utils       import *
@@ -35,6 +36,7 @@ ms_le               = dict(marker='o'                      , markersize=7)   # m
 ms_warning          = dict(marker='o', color='orange'      , markersize=6)   # marker style for wrong points
 ms_leReal           = dict(marker='o', color='limegreen'   , markersize=6)   # marker style for real leading edge
 ms_point            = dict(marker='+'                      , markersize=8)   # marker style for just a point
+ms_none             = dict()                                                # no marker 
 
 
 
@@ -92,6 +94,28 @@ def _plot_bezier_point_marker (ax, side : Side_Airfoil_Bezier, ipoint, color, an
 
 
 
+def _plot_bezier_point_markers (ax, side : Side_Airfoil_Bezier, color):
+    """
+    Plot the markers of all bezier control points of side - same style as '_plot_bezier_point_marker'
+    returns: list of plt marker artists (end points, inner points) 
+    """
+
+    x = side.bezier.points_x
+    y = side.bezier.points_y
+
+    if side.name == UPPER:
+        markerstyle = 6
+    else: 
+        markerstyle = 7
+
+    p_end   = ax.plot ([x[0], x[-1]], [y[0], y[-1]], linestyle='None', marker='.', markersize=3, 
+                       color=color, alpha=0.5) 
+    p_inner = ax.plot (x[1:-1], y[1:-1], linestyle='None', marker=markerstyle, markersize=7, 
+                       color=color, alpha=0.5) 
+    return [p_end, p_inner]
+
+
+
 def _plot_bezier_point_number (ax, side : Side_Airfoil_Bezier, ipoint, color, animated=False):
     """
     Plot a single marker for a bezier control point
@@ -271,7 +295,7 @@ class Airfoil_Artist (Artist):
                 else:  
                     linewidth = 1.2  
                     linestyle = '-'
-                    _marker_style = dict()  
+                    _marker_style = ms_none  
 
                 p = self.ax.plot (airfoil.x, airfoil.y, color=color, label=label, 
                                   linewidth=linewidth, linestyle=linestyle, **_marker_style)
@@ -337,13 +361,13 @@ class Airfoil_Artist (Artist):
             p = self.ax.plot (x,y, linestyle, linewidth=linewidth, color=color, alpha=0.7) 
             self._add(p)
 
-            for ipoint in range (side.nPoints):
+            # plot bezier control point markers - one artist per marker style 
 
-                # plot bezier control point marker 
-
-                p = _plot_bezier_point_marker(self.ax, side, ipoint, color)
+            for p in _plot_bezier_point_markers (self.ax, side, color):
                 self._add(p)
 
+            for ipoint in range (side.nPoints):
+
                 # print point number  
 
                 p = _plot_bezier_point_number (self.ax, side, ipoint, color)
@@ -476,7 +500,7 @@ class Airfoil_Line_Artist (Artist):
     def _marker_style (self):
         """ the marker style to show points"""
         if self._points: return ms_points
-        else:            return dict()
+        else:            return ms_none
 
     
     @property
@@ -513,12 +537,16 @@ class Curvature_Artist (Airfoil_Line_Artist):
         
         airfoil: Airfoil
 
+        # curvature lines without markers are collected and plotted as one LineCollection
+        segments, colors, linestyles = [], [], []
+        linewidth = 1.0 # 0.8
+        alpha = 0.7 # 0.9     
+
         for iair, airfoil in enumerate (self.airfoils):
             if (airfoil.isLoaded):
 
                 curv : Curvature_Abstract = airfoil.geo.curvature
                 color = _color_airfoil_of (airfoil.usedAs)
-                linewidth = 1.0 # 0.8
                 label = None
                 sides = []
                 if self.upper: sides.append (curv.upper)
@@ -528,11 +556,15 @@ class Curvature_Artist (Airfoil_Line_Artist):
                 for side in sides:
                     x = side.x
                     y = side.y      
-                    alpha = 0.7 # 0.9     
                     ls = ls_curvature if side.name == UPPER else ls_curvature_lower
-                    p = self.ax.plot (x, y, ls, color = color, alpha=alpha, label=label, 
-                                      linewidth= linewidth, **self._marker_style)
-                    self._add(p)
+                    if self.points or color is None: 
+                        p = self.ax.plot (x, y, ls, color = color, alpha=alpha, label=label, 
+                                          linewidth= linewidth, **self._marker_style)
+                        self._add(p)
+                    else: 
+                        segments.append (np.column_stack ((x, y)))
+                        colors.append (color)
+                        linestyles.append (ls)
                     self._plot_reversals (side, color)
 
                     # plot derivative1 of curvature ('spikes') only if just one airfoil or DESIGN
@@ -546,6 +578,11 @@ class Curvature_Artist (Airfoil_Line_Artist):
                     if self.showLegend == 'extended':
                         self._print_values (iair, nairfoils, airfoil.name, side, side.name==UPPER, color)
 
+        # added last - lower zorder keeps it below reversal markers and derivative lines as before 
+        if segments: 
+            p = self.ax.add_collection (LineCollection (segments, colors=colors, linestyles=linestyles,
+                                                        alpha=alpha, linewidths=linewidth, zorder=1.9))
+            self._add(p)
 
         self._plot_title (self.name, va='top', ha='center', wspace=0.1, hspace=0.05)
 
@@ -629,10 +666,7 @@ class Difference_Artist (Airfoil_Line_Artist):
 
     def _get_difference (self, side_ref: Side_Airfoil, side_actual: Side_Airfoil_Bezier):
         # calculate difference at y-stations of reference airfoil 
-        diff  = np.zeros (len(side_ref.x))
-        for i, x in enumerate(side_ref.x):
-            diff [i] = side_actual.bezier.eval_y_on_x (x, fast=True) - side_ref.y[i]
-        return diff 
+        return side_actual.bezier.eval_y_on_x_array (side_ref.x, fast=True) - side_ref.y
 
 
     def _plot (self): 
@@ -677,7 +711,7 @@ class Le_Artist (Artist):
     def _marker_style (self):
         """ the marker style to show points"""
         if self._points: return ms_points
-        else:            return dict()
+        else:            return ms_none
 
     @property
     def airfoils (self): 
@@ -1091,7 +1125,7 @@ class Bezier_Edit_Artist (Artist):
                 _marker_style = ms_points
                 linewidth= 0.4
             else:  
-                _marker_style = dict()
+                _marker_style = ms_none
                 linewidth= 0.8
 
             # prepare plot bezier for animated drawing (dashed line) 
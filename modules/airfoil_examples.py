@@ -38,7 +38,8 @@ class Example_Airfoil (Airfoil):
         # over loaded to read airfoil from code  and not from file
         file_lines = self._getCoordinates ()
 
-        self._name, self._x, self._y = self._loadLines(file_lines)
+        self._name, x, y = self._loadLines(file_lines)
+        self._set_xy_buffer (x, y)
 
 
         # class name to identify example airfoil from code  
@@ -69,6 +69,65 @@ LOWER       = 'lower'
 THICKNESS   = 'thickness'
 CAMBER      = 'camber'
 
+# default control points of a new Bezier geometry - Bezier makes its own copy 
+
+BEZIER_UPPER_PX_DEFAULT = np.array ([   0,  0.0, 0.33,  1], dtype=np.float64)
+BEZIER_UPPER_PY_DEFAULT = np.array ([   0, 0.06, 0.12,  0], dtype=np.float64)
+BEZIER_LOWER_PX_DEFAULT = np.array ([   0,   0.0,  0.25,   1], dtype=np.float64)
+BEZIER_LOWER_PY_DEFAULT = np.array ([   0, -0.04, -0.07,   0], dtype=np.float64)
+
+
+
+# -----------------------------------------------------------------------------
+# Helper functions 
+# -----------------------------------------------------------------------------
+
+
+def teGap_blended_y (x : np.ndarray, y : np.ndarray, iLe : int, newGap : float, xBlend = 0.8,
+                     sign : np.ndarray = None) -> np.ndarray:
+    """ returns new y coordinates of a normalized airfoil x,y having te gap 'newGap'.
+     The procedere is based on xfoil allowing to define a blending distance from le.
+     Pure numpy kernel - can be called repeatedly e.g. for a sweep of gaps or blends
+
+    Arguments: 
+        x,y:      coordinates of the normalized airfoil    
+        iLe:      index of leading edge in x,y
+        newGap:   in y-coordinates - typically 0.01 or so 
+        xblend:   the blending distance from trailing edge 0..1 - Default 0.8
+        sign:     optional - precalculated +1 for upper, -1 for lower side (see teGap_sign)
+    """
+
+    xBlend = min( max( xBlend , 0.0 ) , 1.0 )
+
+    gap = y[0] - y[-1]
+    dgap = newGap - gap 
+
+    # thickness factor tails off exponentially away from trailing edge
+    if (xBlend == 0.0):
+        tfac = np.zeros (len(x))
+        tfac[0]  = 1.0
+        tfac[-1] = 1.0
+    else:
+        arg  = np.minimum ((1.0 - x) * (1.0/xBlend -1.0), 15.0)
+        tfac = np.exp(-arg)
+
+    # change the y-thickness of all points at once - upper side up, lower side down
+    if sign is None: 
+        sign = teGap_sign (len(x), iLe)
+    new_y  = sign * (0.5 * dgap)
+    new_y *= x
+    new_y *= tfac
+    new_y += y
+    return new_y
+
+
+def teGap_sign (nPoints : int, iLe : int) -> np.ndarray:
+    """ returns array with +1 for the upper (including le) and -1 for the lower side"""
+
+    sign = np.ones (nPoints)
+    sign[iLe+1:] = -1.0
+    return sign
+
 
 
 # -----------------------------------------------------------------------------
@@ -260,20 +319,19 @@ class Match_Side_Bezier:
         x3  = 0.8                                       # higher density at te
         dx3 = 0.03                                      # to handle reflexed or rear loading
 
-        targ_x = []
-        targ_y = []
+        # collect the indices of the target points - x,y are taken at once  
+        targ_i = []
         x = x1
         while x < 1.0: 
-            i = find_closest_index (target_side.x, x)
-            targ_x.append(target_side.x[i])
-            targ_y.append(target_side.y[i])
+            targ_i.append (find_closest_index (target_side.x, x))
             if x > x3:
                 x += dx3
             elif x > x2:                             
                 x += dx2
             else: 
                 x += dx1
-        return np.array(targ_x), np.array(targ_y)
+        targ_i = np.array (targ_i)
+        return target_side.x[targ_i], target_side.y[targ_i]
 
 
     def set_initial_bezier (self):
@@ -421,9 +479,7 @@ class Match_Side_Bezier:
 
         # evaluate the new y values on Bezier for the target x-coordinate
 
-        y_new = np.zeros (len(self.targets_y))
-        for i, x in enumerate(self.targets_x) :
-            y_new[i] = self.bezier.eval_y_on_x(x, fast=True, epsilon=1e-7)
+        y_new = self.bezier.eval_y_on_x_array (self.targets_x, fast=True, epsilon=1e-7)
 
         # calculate abs difference between bezier y and target y 
         return np.abs((y_new - self.targets_y))
@@ -543,6 +599,7 @@ class Curvature_Abstract:
         self._upper    = None                   # upper side curvature as Side_Airfoil
         self._lower    = None                   # lower side curvature as Side_Airfoil
         self._iLe      = None                   # index of le in curvature array
+        self._curvature = None                  # cached curvature array 
 
     @property
     def upper (self) -> 'Side_Airfoil': 
@@ -665,7 +722,9 @@ class Curvature_of_xy (Curvature_Abstract):
     @property
     def curvature (self): 
         " return the curvature at knots 0..npoints"     
-        return self._spline.curvature (self._spline.u)  
+        if self._curvature is None: 
+            self._curvature = self._spline.curvature (self._spline.u)  
+        return self._curvature
 
 
 
@@ -700,7 +759,9 @@ class Curvature_of_Spline (Curvature_Abstract):
     @property
     def curvature (self): 
         " return the curvature at knots 0..npoints"     
-        return self._spline.curvature (self._spline.u)  
+        if self._curvature is None: 
+            self._curvature = self._spline.curvature (self._spline.u)  
+        return self._curvature
 
 
 
@@ -736,7 +797,13 @@ class Curvature_of_Bezier (Curvature_Abstract):
     @property
     def curvature (self): 
         " return the curvature at knots 0..npoints"     
-        return np.concatenate ((np.flip(self.upper.y), self.lower.y[1:]))
+        if self._curvature is None: 
+            nu = len (self.upper.y)
+            curvature = np.empty (nu + len (self.lower.y) - 1)
+            curvature [:nu] = self.upper.y[::-1]
+            curvature [nu:] = self.lower.y[1:]
+            self._curvature = curvature
+        return self._curvature
 
 
 
@@ -766,6 +833,7 @@ class Side_Airfoil:
         self._name      = name 
         self._threshold = 0.1                   # threshold for reversal dectection 
         self._maximum   = None                  # the highpoint of the spline line
+        self._reversals = None                  # cached reversals with the x,y they are based on 
 
     @property
     def x (self): return self._x
@@ -824,11 +892,25 @@ class Side_Airfoil:
         A reversal is a tuple (x,y) indicating the reversal on self. 
         Reversal detect starts at xStart - to exclude turbulent leading area... 
         """
-        # algorithm from Xoptfoil where a change of sign of y[i] is detected 
-        reversals = []
         x = self.x
         y = self.y
 
+        # x,y of Bezier or Hicks Henne are new arrays when the curve has changed 
+        cached = self._reversals
+        if cached is not None and cached[0] is x and cached[1] is y and cached[2] == (xStart, self.threshold): 
+            return cached[3]
+
+        reversals = self._get_reversals (x, y, xStart)
+        self._reversals = (x, y, (xStart, self.threshold), reversals)
+        return reversals 
+
+
+    def _get_reversals (self, x, y, xStart) -> list:
+        """ returns a list of reversals of x,y starting at xStart"""
+
+        # algorithm from Xoptfoil where a change of sign of y[i] is detected 
+        reversals = []
+
         if not np.any (y < 0.0): return reversals       # early fail if all are positive       
 
         iToDetect = np.nonzero (x >= xStart)[0]
@@ -891,17 +973,19 @@ class Side_Airfoil:
         """ 
         calculates and returns the x,y position of the maximum y value of self
         """
-        max_y = abs(np.max(self.y))
-        min_y = abs(np.min(self.y))
+        i_max_y = np.argmax(self.y)              # scan y only once for max and min 
+        i_min_y = np.argmin(self.y)
+        max_y = abs(self.y[i_max_y])
+        min_y = abs(self.y[i_min_y])
         
         if max_y == 0.0 and min_y == 0.0:              # optimize 
             xmax = 0.5 
             ymax = 0.0 
         else: 
             if max_y > min_y:                   # upper side 
-                imax = np.argmax(self.y)
+                imax = i_max_y
             else:                               # lower side
-                imax = np.argmin(self.y)
+                imax = i_min_y
 
             # build a little helper spline to find exact maximum
             if imax > 3 and imax < (len(self.x) -3 ): 
@@ -950,6 +1034,7 @@ class Side_Airfoil:
     def _reset (self):
         """ reinit self if x,y has changed""" 
         self._maximum  = None                 # thickness distribution
+        self._reversals = None
 
 
 
@@ -1064,6 +1149,8 @@ class Side_Airfoil_Bezier (Side_Airfoil):
         else:
             self._bezier    = Bezier(px,py)             # the bezier curve 
 
+        self._curvature = None                          # cached (x, y, curvature as Side_Airfoil)
+
         # Bezier needs a special u cosinus distribution as the points are bunched
         # by bezier if there is high curvature ... 
         self._u = None
@@ -1151,7 +1238,15 @@ class Side_Airfoil_Bezier (Side_Airfoil):
         !! as side is going from 0..1 the upper side has negative value 
         !! compared to curvature of airfoil which is 1..0..1
         """
-        return Side_Airfoil (self.x, self.bezier.curvature(self._u), name='curvature')
+        # Bezier.eval returns the same arrays until control points or u change 
+        x, y = self.bezier.eval(self._u)
+
+        cached = self._curvature
+        if cached is None or not (cached[0] is x and cached[1] is y): 
+            curvature = Side_Airfoil (x, self.bezier.curvature(self._u), name='curvature')
+            cached = (x, y, curvature)
+            self._curvature = cached
+        return cached[2]
    
     def set_maximum (self, newX=None, newY=None): 
         """ 
@@ -1371,6 +1466,14 @@ class Geometry ():
         self._x = None   
         self._y = None
 
+        self._iLe            = None             # cached values derived from x,y
+        self._isNormalized   = None
+        self._panelAngle_min = None
+        self._upper_side : Side_Airfoil = None  # upper side of x,y 
+        self._lower_side : Side_Airfoil = None  # lower side of x,y
+        self._new_x_sides = {}                  # cached sides evaluated at new x (strak)
+        self._teGap_sign_arr = None             # +1 upper, -1 lower - for te gap blending
+
         self._thickness : Side_Airfoil = None  # thickness distribution
         self._camber    : Side_Airfoil = None  # camber line
 
@@ -1401,30 +1504,46 @@ class Geometry ():
         # ensure copy of x,y and being numpy 
         self._x_org     = np.asarray (x)
         self._y_org     = np.asarray (y)  
+        self._reset_xy ()
+
+
+    def _set_xy (self, x, y):
+        """ set new (modified) coordinates of self - reset cached values depending on x,y """
+
+        self._x = x
+        self._y = y
+        self._reset_xy ()
 
 
     @property
     def iLe (self) -> int: 
         """ the index of leading edge in x coordinate array"""
-        return int(np.argmin (self.x))
+        if self._iLe is None: 
+            self._iLe = int(np.argmin (self.x))
+        return self._iLe
 
     @property
     def isNormalized (self):
         """ true if LE is at 0,0 and TE is symmetrical at x=1"""
+        if self._isNormalized is None: 
+            self._isNormalized = self._eval_isNormalized ()
+        return self._isNormalized
+
+    def _eval_isNormalized (self) -> bool:
+        """ evaluates if LE is at 0,0 and TE is symmetrical at x=1"""
+
+        x, y = self.x, self.y
+        iLe  = self.iLe
 
         # LE at 0,0? 
-        xle, yle = self.x[self.iLe], self.y[self.iLe]
-        normalized =  xle == 0.0 and yle == 0.0
+        if x[iLe] != 0.0 or y[iLe] != 0.0: 
+            return False
 
-        # TE at 1? - numerical issues happen at the last deicmal (numpy -> python?)  
-        xteUp,  yteUp  = self.x[ 0], round(self.y[ 0],10),
-        xteLow, yteLow = self.x[-1], round(self.y[-1],10)
-        if xteUp != 1.0 or xteLow != 1.0: 
-            normalized = False 
-        elif yteUp != - yteLow: 
-            normalized = False        
+        # TE at 1? - numerical issues happen at the last decimal (numpy -> python?)  
+        if x[0] != 1.0 or x[-1] != 1.0: 
+            return False 
 
-        return normalized
+        return round(y[0],10) == - round(y[-1],10)
 
     @property
     def isSymmetrical (self) -> bool:
@@ -1483,18 +1602,19 @@ class Geometry ():
         #           180.d0/acos(-1.d0)
         # maxpanang = max(panang2,panang1)
         ile = self.iLe
-        dx = self.x[ile-1] - self.x[ile]
-        dy = self.y[ile-1] - self.y[ile]
+        x, y = self.x, self.y
+        dx = x[ile-1] - x[ile]
+        dy = y[ile-1] - y[ile]
         if dx > 0.0:
-            angleUp = math.atan (dy/dx) * 180.0 / math.acos(-1)
-        else: 
-            angleUp = 90 
+            angleUp = math.degrees (math.atan (dy/dx))
+        else:
+            angleUp = 90
 
-        dx = self.x[ile+1] - self.x[ile]
-        dy = self.y[ile] - self.y[ile+1]
+        dx = x[ile+1] - x[ile]
+        dy = y[ile] - y[ile+1]
         if dx > 0.0:
-            angleLo = math.atan (dy/dx) * 180.0 / math.acos(-1)
-        else: 
+            angleLo = math.degrees (math.atan (dy/dx))
+        else:
             angleLo = 90 
 
         if angleUp < 90.0 and angleLo < 90.0: 
@@ -1507,19 +1627,26 @@ class Geometry ():
     def panelAngle_min (self): 
         """ returns the min angle between two panels - something between 160-180° - 
         and the point index of the min point"""
-        return np.min(panel_angles(self.x,self.y)),  np.argmin(panel_angles(self.x,self.y))       
+        if self._panelAngle_min is None: 
+            angles = panel_angles(self.x,self.y)
+            self._panelAngle_min = np.min(angles),  np.argmin(angles)
+        return self._panelAngle_min
 
 
     @property
     def upper(self) -> 'Side_Airfoil': 
         """the upper surface as a line object - where x 0..1"""
-        return self.sideDefaultClass (np.flip (self.x [0: self.iLe + 1]),
-                              np.flip (self.y [0: self.iLe + 1]), name=UPPER)
+        if self._upper_side is None: 
+            self._upper_side = self.sideDefaultClass (self.x [self.iLe::-1],
+                                    self.y [self.iLe::-1], name=UPPER)
+        return self._upper_side
             
     @property
     def lower(self) -> 'Side_Airfoil': 
         """the lower surface as a line object - where x 0..1"""
-        return self.sideDefaultClass (self.x[self.iLe:], self.y[self.iLe:], name=LOWER)
+        if self._lower_side is None: 
+            self._lower_side = self.sideDefaultClass (self.x[self.iLe:], self.y[self.iLe:], name=LOWER)
+        return self._lower_side
 
     def side(self, sideName) -> 'Side_Airfoil': 
         """side with 'side_name' as a line object - where x 0..1"""
@@ -1591,31 +1718,18 @@ class Geometry ():
                 ErrorMsg ("Airfoil can't be normalized. Te gap can't be set.")
                 return  
         
-        x = np.copy (self.x) 
-        y = np.copy (self.y) 
-        xBlend = min( max( xBlend , 0.0 ) , 1.0 )
-
-        gap = y[0] - y[-1]
-        dgap = newGap - gap 
-        ile = self.iLe
-
-        # go over each point, changing the y-thickness appropriately
-        for i in range(len(x)):
-            # thickness factor tails off exponentially away from trailing edge
-            if (xBlend == 0.0): 
-                tfac = 0.0
-                if (i == 0 or i == (len(x)-1)):
-                    tfac = 1.0
-            else:
-                arg = min ((1.0 - x[i]) * (1.0/xBlend -1.0), 15.0)
-                tfac = np.exp(-arg)
+        x    = self.x                           # x isn't changed - no copy needed 
+        iLe  = self.iLe
+        sign = self._teGap_sign
+        y = teGap_blended_y (x, self.y, iLe, newGap, xBlend, sign=sign)
 
-            if i <= ile: 
-                y[i] = y[i] + 0.5 * dgap * x[i] * tfac # * gap 
-            else:
-                y[i] = y[i] - 0.5 * dgap * x[i] * tfac # * gap   
+        self._set_xy (x, y)
+        self._reset_lines()                     # the child lines like thickness
+        self._reset_spline()                    # the spline (if exists)
 
-        self._x, self._y = x, y 
+        # x is unchanged - keep le index and signs for the next te gap setting 
+        self._iLe            = iLe
+        self._teGap_sign_arr = sign
 
 
 
@@ -1674,9 +1788,10 @@ class Geometry ():
         Using linear interpolation - shall be overloaded 
         """
         # evaluate the corresponding y-values on lower side 
+        upper   = self.upper
         upper_y = np.zeros (len(new_x))
         for i, x in enumerate (new_x):
-            upper_y[i] = self.upper.yFn(x)
+            upper_y[i] = upper.yFn(x)
 
         upper_y = np.round(upper_y, 10)
 
@@ -1690,9 +1805,10 @@ class Geometry ():
         Using linear interpolation - shall be overloaded 
         """
         # evaluate the corresponding y-values on lower side 
+        lower   = self.lower
         lower_y = np.zeros (len(new_x))
         for i, x in enumerate (new_x):
-            lower_y[i] = self.lower.yFn(x)
+            lower_y[i] = lower.yFn(x)
 
         lower_y = np.round(lower_y, 10)
 
@@ -1710,8 +1826,7 @@ class Geometry ():
 
         # ensure a copy of x,y 
         if self._x is None:
-            self._x = np.asarray (self.x)
-            self._y = np.asarray (self.y) 
+            self._set_xy (np.asarray (self.x), np.asarray (self.y)) 
 
         # Translate so that the leading edge is at 0,0 
         xLe, yLe = self.le_real
@@ -1753,8 +1868,7 @@ class Geometry ():
         xn[0]   = 1.0 
         xn[-1]  = 1.0
 
-        self._x = np.round (xn, 10) + 0.0
-        self._y = np.round (yn, 10) + 0.0 
+        self._set_xy (np.round (xn, 10) + 0.0, np.round (yn, 10) + 0.0) 
         # re-init 
         self._reset_lines()                     # the child lines like thickness
         self._reset_spline()                    # the spline (if exists)
@@ -1793,13 +1907,22 @@ class Geometry ():
         # optimze edge cases 
 
         if blendBy == 0:
-            self._x = geo1.x
-            self._y = geo1.y
-            return
+            self._set_xy (geo1.x, geo1.y)
         elif blendBy == 1.0:
-            self._x = geo2.x
-            self._y = geo2.y
-            return
+            self._set_xy (geo2.x, geo2.y)
+        else: 
+            self._strak_blend (geo1, geo2, blendBy)
+
+        # re-init 
+        self._reset_lines()                     # the child lines like thickness
+        self._reset_spline()                    # the spline (if exists)
+
+
+    # ------------------ private ---------------------------
+
+
+    def _strak_blend (self, geo1 : 'Geometry', geo2 : 'Geometry', blendBy):
+        """ blends x,y of self out of two normalized geometries with 0 < blendBy < 1"""
       
         # the leading airfoil is the one with higher share
 
@@ -1807,32 +1930,70 @@ class Geometry ():
  
             upper1 = geo1.upper
             lower1 = geo1.lower
-            upper2 = geo2.upper_new_x (geo1.upper.x)
-            lower2 = geo2.lower_new_x (geo1.lower.x)
+            upper2 = geo2._side_new_x (UPPER, geo1.upper.x)
+            lower2 = geo2._side_new_x (LOWER, geo1.lower.x)
 
             upper_x  = geo1.upper.x
             lower_x  = geo1.lower.x
 
         else:
 
-            upper1 = geo1.upper_new_x (geo2.upper.x)
-            lower1 = geo1.lower_new_x (geo2.lower.x)
+            upper1 = geo1._side_new_x (UPPER, geo2.upper.x)
+            lower1 = geo1._side_new_x (LOWER, geo2.lower.x)
             upper2 = geo2.upper
             lower2 = geo2.lower
 
             upper_x  = geo2.upper.x
             lower_x  = geo2.lower.x
 
-        # now blend upper and lower of both airfoils 
-        upper_y = (1 - blendBy) * upper1.y + blendBy * upper2.y
-        lower_y = (1 - blendBy) * lower1.y + blendBy * lower2.y
-        
-        # rebuild x,y coordinates 
-        self._x = np.concatenate ((np.flip(upper_x), lower_x[1:]))
-        self._y = np.concatenate ((np.flip(upper_y), lower_y[1:]))
+        # rebuild x,y coordinates - directly into the new arrays, upper side reversed 
+        nu = len(upper_x)
+        x  = np.empty (nu + len(lower_x) - 1)
+        y  = np.empty_like (x)
 
+        x[:nu] = upper_x[::-1]
+        x[nu:] = lower_x[1:]
+
+        # now blend upper and lower of both airfoils - in place without temporaries
+        w1  = 1 - blendBy
+        w2  = blendBy
+        tmp = np.empty_like (y)                 # share of airfoil 2
+
+        np.multiply (upper1.y[::-1], w1, out=y[:nu])
+        np.multiply (lower1.y[1:],   w1, out=y[nu:])
+        np.multiply (upper2.y[::-1], w2, out=tmp[:nu])
+        np.multiply (lower2.y[1:],   w2, out=tmp[nu:])
+        y += tmp
+
+        self._set_xy (x, y)
 
-    # ------------------ private ---------------------------
+
+    @property
+    def _teGap_sign (self) -> np.ndarray:
+        """ +1 for upper and -1 for lower side points - cached for repeated te gap setting"""
+        if self._teGap_sign_arr is None: 
+            self._teGap_sign_arr = teGap_sign (self.nPoints, self.iLe)
+        return self._teGap_sign_arr
+
+
+    def _side_new_x (self, side_name, new_x) -> 'Side_Airfoil':
+        """ 
+        returns upper or lower side of self evaluated at new_x. 
+        The result is cached for the new_x array object, so a sweep of strak blends 
+        with the same partner geometry evaluates the interpolation only once  
+        """
+
+        cached = self._new_x_sides.get (side_name)
+
+        if cached is None or cached[0] is not new_x: 
+            if side_name == UPPER: 
+                side = self.upper_new_x (new_x)
+            else: 
+                side = self.lower_new_x (new_x)
+            cached = (new_x, side)                      # keep new_x - 'is' needs a living object
+            self._new_x_sides[side_name] = cached
+
+        return cached[1]
 
 
     def _eval_thickness_camber (self): 
@@ -1863,14 +2024,16 @@ class Geometry ():
 
         # thickness and camber can now easily calculated 
 
-        self._thickness = self.sideDefaultClass (upper.x, (upper.y - lower.y), 
-                                            name=THICKNESS)
-        self._camber    = self.sideDefaultClass (upper.x, (upper.y + lower.y) / 2.0, 
-                                            name=CAMBER)
+        camber_y  = upper.y + lower.y
+        camber_y /= 2.0   
 
         # for symmetric airfoil with unclean data set camber line to 0 
-        if np.max(self._camber._y) < 0.00001: 
-            self._camber._y = np.zeros (len(self._camber._y))
+        if np.max(camber_y) < 0.00001: 
+            camber_y.fill (0.0)
+
+        self._thickness = self.sideDefaultClass (upper.x, (upper.y - lower.y), 
+                                            name=THICKNESS)
+        self._camber    = self.sideDefaultClass (upper.x, camber_y, name=CAMBER)
 
         if not self.thickness.isNormalized or not self.camber.isNormalized:
             raise ValueError ("eval thickness: Thickness or Camber are not normalized")
@@ -1895,8 +2058,8 @@ class Geometry ():
         x_lower = self.thickness.x
         y_lower = self.camber.y - self.thickness.y / 2.0
 
-        self._x = np.concatenate ((np.flip(x_upper), x_lower[1:]))
-        self._y = np.concatenate ((np.flip(y_upper), y_lower[1:]))
+        self._set_xy (np.concatenate ((np.flip(x_upper), x_lower[1:])),
+                      np.concatenate ((np.flip(y_upper), y_lower[1:])))
 
         # reset only curvature 
         self._curvature = None
@@ -1909,6 +2072,16 @@ class Geometry ():
         self._camber     = None                 # camber line
         self._curvature  = None                 # curvature 
 
+    def _reset_xy (self):
+        """ reinit cached values of self which are derived from x,y""" 
+        self._iLe            = None             # index of leading edge
+        self._isNormalized   = None
+        self._panelAngle_min = None
+        self._upper_side     = None             # upper and lower side line objects
+        self._lower_side     = None
+        self._new_x_sides    = {}               # sides evaluated at new x 
+        self._teGap_sign_arr = None
+
     def _reset_spline (self):
         """ reinit self spline data if x,y has changed""" 
         # to be overloaded
@@ -1974,13 +2147,13 @@ class Geometry_Splined (Geometry):
         else: 
             return True
 
-    @property
-    def isNormalized (self):
+    def _eval_isNormalized (self) -> bool:
         """ 
         true if LE is at 0,0 and TE is symmetrical at x=1
            and real le (spline) is close to le
         """
-        return super().isNormalized and self._isLe_closeTo_le_real
+        # overloaded
+        return super()._eval_isNormalized() and self._isLe_closeTo_le_real
 
 
     @property
@@ -2166,8 +2339,7 @@ class Geometry_Splined (Geometry):
         # new calculated x,y coordinates  
         x, y = self.xyFn(u_new)
 
-        self._x = np.round (x, 10)
-        self._y = np.round (y, 10)
+        self._set_xy (np.round (x, 10), np.round (y, 10))
 
         # reset the child lines, keep current spline as it was the master
         self._reset_lines()
@@ -2232,6 +2404,8 @@ class Geometry_Splined (Geometry):
         """ reinit self spline data if x,y has changed""" 
         self._spline     = None
         self._uLe        = None                  # u value at LE 
+        self._isNormalized = None                # depends on spline le 
+        self._new_x_sides  = {}                  # sides evaluated with spline
 
 
     def _rebuild_from_thicknessCamber(self):
@@ -2265,7 +2439,7 @@ class Geometry_Splined (Geometry):
     def _le_find (self):
         """ returns u (arc) value of leading edge based on scalar product tangent and te vector = 0"""
 
-        iLeGuess = np.argmin (self.x)          # first guess for Le point 
+        iLeGuess = self.iLe                    # first guess for Le point 
 
         # exact determination of root  = scalar product = 0.0 
         try: 
@@ -2292,7 +2466,7 @@ class Geometry_Splined (Geometry):
         yOut : np array - evaluated y values 
         """
 
-        iLe = np.argmin (self.x)
+        iLe = self.iLe
 
         if side == LOWER: 
             uStart = self.spline.u[iLe] 
@@ -2345,6 +2519,8 @@ class Geometry_Bezier (Geometry):
         self._upper      = None                 # upper side as Side_Airfoil_Bezier object
         self._lower      = None                 # lower side 
 
+        self._xy_bezier  = None                 # cached (upper x, lower x, x, y) of the Bezier curves
+
     
     @property
     def isNormalized (self):
@@ -2366,9 +2542,7 @@ class Geometry_Bezier (Geometry):
         # overloaded
         if self._upper is None: 
             # default side
-            px = [   0,  0.0, 0.33,  1]
-            py = [   0, 0.06, 0.12,  0]    
-            self._upper = Side_Airfoil_Bezier (px, py, name=UPPER)
+            self._upper = Side_Airfoil_Bezier (BEZIER_UPPER_PX_DEFAULT, BEZIER_UPPER_PY_DEFAULT, name=UPPER)
         return self._upper 
 
     @property
@@ -2377,9 +2551,7 @@ class Geometry_Bezier (Geometry):
         # overloaded
         if self._lower is None: 
             # default side 
-            px = [   0,   0.0,  0.25,   1]
-            py = [   0, -0.04, -0.07,   0]  
-            self._lower = Side_Airfoil_Bezier (px, py, name=LOWER)
+            self._lower = Side_Airfoil_Bezier (BEZIER_LOWER_PX_DEFAULT, BEZIER_LOWER_PY_DEFAULT, name=LOWER)
 
         return self._lower 
     
@@ -2397,18 +2569,24 @@ class Geometry_Bezier (Geometry):
     @property
     def x (self):
         # overloaded  - take from bezier 
-        return np.concatenate ((np.flip(self.upper.x), self.lower.x[1:]))
+        return self._get_xy_bezier()[0]
 
     @property
     def y (self):
         # overloaded  - take from bezier 
-        return np.concatenate ((np.flip(self.upper.y), self.lower.y[1:]))
+        return self._get_xy_bezier()[1]
     
     @property
     def nPoints (self): 
         """ number of coordinate points"""
         return len (self.upper.x) + len (self.lower.x) - 1
 
+    @property
+    def iLe (self) -> int: 
+        """ the index of leading edge in x coordinate array - Bezier always end of upper"""
+        # overloaded - no caching as control points may change
+        return len (self.upper.x) - 1
+
     @property
     def le (self) -> tuple: 
         """ coordinates of le - Bezier always 0,0 """
@@ -2486,16 +2664,41 @@ class Geometry_Bezier (Geometry):
     # ------------------ private ---------------------------
 
 
+    def _reset_lines (self):
+        """ reinit the dependand lines of self""" 
+        # overloaded - x,y are derived from the Bezier curves and have changed as well
+        super()._reset_lines()
+        self._reset_xy()
+
+
+    def _get_xy_bezier (self) -> tuple:
+        """ 
+        returns x,y of upper and lower Bezier curve joined at le. 
+        Cached as long as the Bezier curves return their cached evaluation  
+        """
+
+        # Bezier.eval returns the same arrays until control points or u change 
+        upper_x = self.upper.x
+        lower_x = self.lower.x
+
+        cached = self._xy_bezier
+        if cached is None or cached[0] is not upper_x or cached[1] is not lower_x: 
+            x = np.concatenate ((upper_x[::-1], lower_x[1:]))
+            y = np.concatenate ((self.upper.y[::-1], self.lower.y[1:]))
+            cached = (upper_x, lower_x, x, y)
+            self._xy_bezier = cached
+
+        return cached[2], cached[3]
+
+
+
     def upper_new_x (self, new_x) -> 'Side_Airfoil': 
         """
         returns side_Airfoil having new_x and new, calculated y coordinates
         Using bezier interpolation  
         """
         # evaluate the corresponding y-values on upper side 
-        upper_y = np.zeros (len(new_x))
- 
-        for i, x in enumerate (new_x):
-            upper_y[i] = self.upper.bezier.eval_y_on_x (x, fast=True)  
+        upper_y = self.upper.bezier.eval_y_on_x_array (new_x, fast=True)  
 
         upper_y = np.round(upper_y, 10)
 
@@ -2508,18 +2711,12 @@ class Geometry_Bezier (Geometry):
         Using bezier interpolation  
         """
         # evaluate the corresponding y-values on lower side 
-        lower_y = np.zeros (len(new_x))
- 
         # !! bezier must be evaluated with u to have x,y !! 
-        for i, x in enumerate (new_x):
+        lower_y = self.lower.bezier.eval_y_on_x_array (new_x, fast=True)  
 
-            # first and last point from current lower to avoid numerical issues 
-            if i == 0: 
-                lower_y[i] = self.lower.y[0]
-            elif i == (len(new_x) -1):
-                lower_y[i] = self.lower.y[-1]
-            else:
-                lower_y[i] = self.lower.bezier.eval_y_on_x (x, fast=True)  
+        # first and last point from current lower to avoid numerical issues 
+        lower_y[0]  = self.lower.y[0]
+        lower_y[-1] = self.lower.y[-1]
 
         lower_y = np.round(lower_y, 10)
 
@@ -2554,8 +2751,8 @@ class Geometry_HicksHenne (Geometry):
         # overloaded
         if self._upper is None: 
             iLe = int(np.argmin (self._seed_x))
-            upper_x = np.flip (self._seed_x [0: iLe + 1])
-            upper_y = np.flip (self._seed_y [0: iLe + 1])
+            upper_x = self._seed_x [iLe::-1]
+            upper_y = self._seed_y [iLe::-1]
             self._upper = Side_Airfoil_HicksHenne (upper_x, upper_y, [], name=UPPER)
         return self._upper 
             
@@ -2589,6 +2786,13 @@ class Geometry_HicksHenne (Geometry):
     # ------------------ private ---------------------------
 
 
+    def _reset_lines (self):
+        """ reinit the dependand lines of self""" 
+        # overloaded - x,y are derived from the hicks henne functions and have changed as well
+        super()._reset_lines()
+        self._reset_xy()
+
+
 
 # ------------ test functions - to activate  -----------------------------------
 
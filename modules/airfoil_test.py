@@ -9,11 +9,14 @@
 import pytest
 
 import numpy as np 
+import os
+from pathlib import Path
 
 from airfoil import Airfoil, Airfoil_Bezier, GEO_BASIC, GEO_SPLINE
 from airfoil_examples import Root_Example, Tip_Example
 from airfoil_geometry import Geometry, Geometry_Splined, Geometry_Bezier
 from airfoil_geometry import Curvature_of_xy, Curvature_of_Spline, Curvature_of_Bezier
+from airfoil_geometry import Side_Airfoil, UPPER
 
 
 class Test_Airfoil:
@@ -196,6 +199,29 @@ class Test_Airfoil:
 
 
 
+    def test_airfoil_normalize_splined (self):
+
+        p_examples = Path(__file__).parent.parent / 'examples' / 'Amokka-JX'
+
+        airfoil = Airfoil (pathFileName=str(p_examples / 'JX-RS.dat'), geometry = GEO_SPLINE)
+        airfoil.load()
+        assert not airfoil.isNormalized
+
+        airfoil.normalize()
+        assert airfoil.isNormalized
+
+        # strak of normalized airfoils has to be normalized 
+
+        tip = Airfoil (pathFileName=str(p_examples / 'JX-RS-Tip.dat'), geometry = GEO_SPLINE)
+        tip.load()
+        tip.normalize()
+
+        strak = Airfoil (name="<strak>", geometry = GEO_SPLINE)
+        strak.do_strak (tip, airfoil, blendBy=0.7)
+        assert strak.isNormalized
+
+
+
     def test_airfoil_file_functions (self):
 
         from pathlib import Path
@@ -233,10 +259,141 @@ class Test_Airfoil:
         new_airfoil = Airfoil (pathFileName=newPathFileName)
         new_airfoil.load()
 
-
         shutil.rmtree(str(p_tmp))
 
 
+    def test_airfoil_load_many (self, tmp_path):
+
+        # different files - some of them twice 
+
+        pathFileNames, expected = [], []
+        for i in range(6):
+            airfoil = Root_Example() if i % 2 else Tip_Example()
+            pathFileNames.append (airfoil.saveAs (dir=str(tmp_path), destName=f'airfoil_{i}'))
+            expected.append (airfoil)
+        pathFileNames += pathFileNames[:3]
+        expected      += expected[:3]
+
+        # load many in parallel - result in order of input 
+
+        airfoils = Airfoil.load_many (pathFileNames)
+
+        assert [a.name for a in airfoils] == [a.name for a in expected]
+        for airfoil, expected_airfoil in zip (airfoils, expected):
+            assert np.array_equal (airfoil.x, expected_airfoil.x)
+            assert np.array_equal (airfoil.y, expected_airfoil.y)
+
+
+    def test_airfoil_load_reread (self, tmp_path):
+
+        pathFileName = str(tmp_path / 'reread.dat')
+
+        with open(pathFileName, 'w') as f:
+            f.write ("first\n1.0 0.0\n0.0 0.0\n1.0 0.0\n")
+
+        airfoil = Airfoil (pathFileName=pathFileName)
+        airfoil.load()
+        assert airfoil.name == 'first'
+
+        # file changed on disk (by someone else) - must be read again
+
+        with open(pathFileName, 'w') as f:
+            f.write ("second\n1.0 0.0\n0.0 0.01\n1.0 0.0\n")
+        stat = os.stat (pathFileName)
+        os.utime (pathFileName, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+        airfoil = Airfoil (pathFileName=pathFileName)
+        airfoil.load()
+        assert airfoil.name == 'second'
+        assert airfoil.y[1] == 0.01
+
+
+    def test_airfoil_save_reload_workingDir (self, tmp_path, monkeypatch):
+
+        monkeypatch.chdir (tmp_path)
+        pathFileName = os.path.basename (Root_Example().saveAs (dir='.'))
+        mtime_ns = os.stat(pathFileName).st_mtime_ns
+
+        airfoil = Airfoil (pathFileName=pathFileName, workingDir=str(tmp_path))
+        airfoil.load()
+        y_before = airfoil.y[10]
+
+        # save same size within the same mtime tick - must not be served from cache
+
+        y = np.copy (airfoil.y)
+        y[10] = round (y_before + 0.0000001, 7)
+        airfoil.set_xy (airfoil.x, y)
+        airfoil.save()
+        os.utime (pathFileName, ns=(mtime_ns, mtime_ns))
+
+        airfoil = Airfoil (pathFileName=pathFileName, workingDir=str(tmp_path))
+        airfoil.load()
+        assert airfoil.y[10] == y[10]
+
+
+    def test_side_reversals_cache (self):
+
+        x = np.linspace (0.0, 1.0, 21)
+        side = Side_Airfoil (x, np.sin (x * 2 * np.pi), name=UPPER)
+
+        reversals = side.reversals()
+        assert len(reversals) == 1
+        assert side.reversals() is reversals                    # cached
+
+        side.set_y (np.sin (x * 4 * np.pi))
+        assert side.nreversals == 3
+
+
+    def test_geo_sides_cache (self):
+
+        airfoil1 = Root_Example(geometry = GEO_SPLINE)
+        airfoil2 = Tip_Example (geometry = GEO_SPLINE)
+        airfoil1.normalize()
+        airfoil2.normalize()
+        geo1, geo2 = airfoil1.geo, airfoil2.geo
+
+        upper = geo2.upper
+        assert geo2.upper is upper                              # cached
+
+        strak = Geometry_Splined (np.copy(geo1.x), np.copy(geo1.y))
+        strak.strak (geo1, geo2, 0.3)                           # geo2 evaluated at x of geo1
+        y_before = np.copy (strak.y)
+
+        # new te gap of geo2 - its sides also at the x of geo1 must follow 
+
+        geo2.set_teGap (0.02)
+        assert geo2.upper is not upper
+        assert geo2.upper.y[-1] != upper.y[-1]
+
+        strak.strak (geo1, geo2, 0.3)
+
+        strak_new = Geometry_Splined (np.copy(geo1.x), np.copy(geo1.y))
+        strak_new.strak (geo1, Geometry_Splined (np.copy(geo2.x), np.copy(geo2.y)), 0.3)
+
+        assert not np.array_equal (strak.y, y_before)
+        assert np.array_equal (strak.y, strak_new.y)
+
+
+    def test_geo_teGap_sign_cache (self):
+
+        airfoil = Root_Example(geometry = GEO_SPLINE)
+        airfoil.normalize()
+        geo : Geometry_Splined = airfoil.geo
+
+        geo.set_teGap (0.01)
+
+        # new x with a different le index - te gap must be set like on a new geometry
+
+        geo.repanel (nPanels=250)
+        geo_new = Geometry_Splined (np.copy(geo.x), np.copy(geo.y))
+
+        geo.set_teGap (0.02)
+        geo_new.set_teGap (0.02)
+
+        assert np.array_equal (geo.y, geo_new.y)
+        assert round(geo.teGap,10) == 0.02
+
+
 
 class Test_Airfoil_Bezier:
 
@@ -309,7 +466,40 @@ class Test_Airfoil_Bezier:
 
         te_curv = curv.lower.y[-10:]
         assert round(np.min (np.abs(te_curv)),3) == 0.062
-    
+
+
+    def test_bezier_curvature_cache (self):
+
+        airfoil = Airfoil_Bezier()
+        upper = airfoil.geo.upper
+
+        curv_before = upper.curvature
+        assert upper.curvature is curv_before                   # cached
+
+        # moving a control point changes the bezier directly - curvature must follow
+
+        upper.move_controlPoint_to (2, 0.4, 0.15)
+        airfoil.reset()
+
+        assert upper.curvature is not curv_before
+        assert not np.array_equal (upper.curvature.y, curv_before.y)
+        assert not np.array_equal (airfoil.geo.curvature.upper.y, curv_before.y)
+
+
+    def test_bezier_xy_cache (self):
+
+        airfoil = Airfoil_Bezier()
+        geo : Geometry_Bezier = airfoil.geo
+
+        x, y = geo.xy
+        assert geo.xy[0] is x                                   # cached
+
+        geo.upper.move_controlPoint_to (2, 0.4, 0.15)
+        airfoil.reset()
+
+        assert geo.x is not x
+        assert not np.array_equal (geo.y, y)
+
 
 
 # Main program for testing 
@@ -354,10 +354,9 @@ class PROFIL (FLZ_Element):
         self._write (aStream, self.startTag)
         self._write (aStream, "PROFILDATEINAME=%s.dat" % self.airfoil.name)
 
-        for i, xc in enumerate (self.airfoil.x):
-            yc = self.airfoil.y[i]
-            # if i < 3 : 
-            self._write (aStream, "PK%d=%.5f %.5f" % (i, xc, yc))
+        # all coordinate lines formatted at once and written with a single call
+        xy = zip (self.airfoil.x.tolist(), self.airfoil.y.tolist())
+        self._write (aStream, "\n".join (["PK%d=%.5f %.5f" % (i, xc, yc) for i, (xc, yc) in enumerate (xy)]))
 
         self._write (aStream, self.endTag)
 
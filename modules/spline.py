@@ -8,7 +8,6 @@
 """
 import bisect
 import numpy as np
-from copy import deepcopy
 import math
 from math_util import findMin, newton
 
@@ -565,7 +564,7 @@ class Spline2D:
 
 # Binomial Coefficients 
 def Ni(n,i): 
-    return math.factorial(n) / (math.factorial(i) * math.factorial(n-i))
+    return float (math.comb(n, i))
 
 # Bernstein Basis Polynomial 
 def basisFunction (n, i, u):
@@ -599,6 +598,7 @@ class Bezier:
         self._u  = None                         # cached parameter u 
 
         self.basisFn = None                     # stored Bezier basis function for test 
+        self._binomials = {}                    # cached binomial coefficients per degree 
 
         self.set_points(px_or_p, py)
         return
@@ -725,6 +725,35 @@ class Bezier:
         return x, y
 
 
+    def forward_diff (self, nPoints):
+        """
+        Evaluate self at nPoints uniform u 0..1 using forward differencing. 
+        Only cubic Bezier curves are supported - other degrees are evaluated with 'eval'.
+        Results will be cached like 'eval'
+
+        Parameters
+        ----------
+        nPoints :   number of uniform distributed u 0..1 
+
+        Returns
+        -------
+        x,y : arrays representing the evaluated values
+        """
+
+        u = np.linspace (0.0, 1.0, nPoints)
+
+        if self.npoints != 4 or nPoints < 3:
+            return self.eval (u)
+
+        if np.array_equal (u, self._u) and (not self._x is None):
+            return self._x, self._y                 # old u array - use cache 
+
+        self._u = u 
+        self._x = self._forward_diff_1D (self._px, nPoints)
+        self._y = self._forward_diff_1D (self._py, nPoints)
+        return self._x, self._y
+
+
     def eval_y (self, u, der=0):
         """
         Evaluate only y based on u -  use for single value evaluation  
@@ -786,6 +815,49 @@ class Bezier:
 
             # print ("Newton iter", niter, x - self._eval_1D (self._px, u))
         return y
+
+
+    def eval_y_on_x_array (self, x, fast=True, epsilon=10e-10):
+        """
+        Evaluate the y values based on an array of x - vectorized version of 'eval_y_on_x'
+
+        For fast=True the u(x) interpolation is done for all x within the cached x range
+        in one go. For the remaining x u(x) is found with a batched Newton iteration 
+
+        Parameters
+        ----------
+        x :   array of x-values 
+        fast : bool, optional - only a linear interpolation of u is made .
+
+        Returns
+        -------
+        y : array of y evaluated at x 
+        """
+
+        x = np.asarray (x, dtype=float)
+        y = np.empty (len(x))
+
+        if fast and (not self._x is None):
+            bx, bu = self._x, self._u
+            inside = (x >= bx[0]) & (x <= bx[-1])
+            xi = x[inside]
+
+            # find closest index
+            i = np.minimum (np.searchsorted (bx, xi, side='right') - 1, len(bx) - 2)
+
+            # interpolate u 
+            u = ((bu[i+1]-bu[i])/(bx[i+1]-bx[i])) * (xi - bx[i]) + bu[i]
+
+            # evaluate y from u 
+            y[inside] = self._eval_1D (self._py, u)
+        else: 
+            inside = np.zeros (len(x), dtype=bool)
+
+        if not np.all (inside):
+            u = self._eval_u_on_x_newton (x[~inside], epsilon=epsilon)
+            y[~inside] = self._eval_1D (self._py, u)
+
+        return y
         
 
 
@@ -881,7 +953,7 @@ class Bezier:
         # http://math.aalto.fi/~ahniemi/hss2012/Notes06.pdf
 
         n = np.size(pxy) - 1                            # n - degree of Bezier 
-        weights = deepcopy(pxy)                         # der = 0: weights = points 
+        weights = pxy                                   # der = 0: weights = points 
         if der > 0:                                     
             weights = np.ediff1d(weights) * n           # new weight = difference * n 
             n = n - 1                                   # lower 1 degree 
@@ -889,17 +961,105 @@ class Bezier:
             weights = np.ediff1d(weights) * n           # new weight = difference * n                           
             n = n - 1                                   # lower 1 degree 
 
+        # cubic and quadratic fast path - same terms as the general form without the loop   
+
+        if n == 3: 
+            mt = 1 - u
+            bezier += mt ** 3 * weights[0] 
+            bezier += 3.0 * u * mt ** 2 * weights[1]
+            bezier += 3.0 * u ** 2 * mt * weights[2] 
+            bezier += u ** 3 * weights[3] 
+            return bezier
+        elif n == 2: 
+            mt = 1 - u
+            bezier += mt ** 2 * weights[0] 
+            bezier += 2.0 * u * mt * weights[1]
+            bezier += u ** 2 * weights[2] 
+            return bezier
+
+        binomials = self._binomial_coefficients (n)
+
         # test self.basisFn = []   
     
         for i in range (len(weights)):
             
             # collect bernstein Polynomial self.basisFn.append (basisFunction(n, i, u))  
 
-            bezier += basisFunction(n, i, u) * weights[i] 
+            bezier += binomials[i] * (u ** i) * (1 - u) ** (n - i) * weights[i] 
 
         return bezier
 
 
+    def _binomial_coefficients (self, n):
+        # binomial coefficients of degree n - cached as degree of self and its derivatives is fixed
+
+        binomials = self._binomials.get (n)
+        if binomials is None: 
+            binomials = [Ni(n, i) for i in range (n+1)]
+            self._binomials [n] = binomials
+        return binomials
+
+
+    def _eval_u_on_x_newton (self, x, epsilon=10e-10, max_iter=20):
+        #
+        # finds u for an array of x with Newton iteration on all x at once 
+        #   same steps as 'newton' in 'eval_y_on_x' - converged x are dropped 
+
+        u = np.where (x < 0.05, 0.05, np.where (x > 0.95, 0.95, x))   # start values 
+
+        at_start = x == self._eval_1D(self._px, 0.0)    # avoid numerical issues of Newton 
+        u[at_start] = 0.0
+        active = np.flatnonzero (~at_start)
+
+        for _ in range (max_iter):
+            if len(active) == 0: break
+
+            ua = np.clip (u[active], 0.0, 1.0)
+            fu = self._eval_1D(self._px, ua) - x[active]
+            converged = np.abs(fu) < epsilon
+
+            dfu  = self._eval_1D(self._px, ua, der=1)
+            zero = (dfu == 0) & ~converged
+            if np.any (zero & (ua != 0.0)):
+                raise ValueError ("Newton iteration: Zero derivative. No solution found.")
+
+            step = ~(converged | zero)                  # zero derivative at LE - stop there 
+            ua[step] = ua[step] - fu[step] / dfu[step]
+            u[active] = ua
+            active = active[step]
+
+        return u
+
+
+    def _forward_diff_1D (self, pxy, nPoints):
+        #
+        # evaluates a cubic Bezier at nPoints uniform u with forward differencing 
+        #   the 3rd difference is constant - the lower differences and the values 
+        #   are accumulated with cumsum instead of evaluating the polynomial 
+
+        p0, p1, p2, p3 = pxy
+        n = nPoints - 1                                 # number of steps 
+
+        rt1 = 3.0 * (p1 - p0) / n
+        rt2 = 3.0 * (p0 - 2.0 * p1 + p2) / n**2
+        rt3 = (p3 - p0 + 3.0 * (p1 - p2)) / n**3
+
+        q1 = rt1 + rt2 + rt3                            # 1st difference at u=0
+        q2 = 2.0 * rt2 + 6.0 * rt3                      # 2nd difference at u=0
+        q3 = 6.0 * rt3                                  # constant 3rd difference 
+
+        d2 = q2 + q3 * np.arange (n-1)
+        d1 = np.empty (n)
+        d1[0]  = q1
+        d1[1:] = q1 + np.cumsum (d2)
+
+        result = np.empty (nPoints)
+        result[0]  = p0
+        result[1:] = p0 + np.cumsum (d1)
+        result[-1] = p3                                 # avoid accumulated error at end 
+        return result
+
+
 
 #------------ Hicks Henne  -----------------------------------
 
@@ -94,9 +94,79 @@ class Test_Spline:
         pass
 
 
+class Test_Bezier:
+
+    def test_bezier_y_on_x_array (self): 
+
+        px = [  0,   0, 0.3,  1]  
+        py = [  0, 0.1, 0.15, 0]  
+
+        bez = Bezier (px, py)
+        x_cached, _ = bez.eval (np.linspace (0.1, 0.9, 50))   # cached x range is 'inside' 
+
+        x = np.concatenate ((np.linspace (0.0, 1.0, 41), [0.001, 0.999]))
+        assert np.any (x < x_cached[0]) and np.any (x > x_cached[-1])
+
+        # fast - linear u interpolation inside, Newton outside of cached range  
+        y = bez.eval_y_on_x_array (x, fast=True)
+        y_scalar = [bez.eval_y_on_x (xi, fast=True) for xi in x]
+        assert np.array_equal (y, y_scalar)
+
+        # Newton for all x 
+        y = bez.eval_y_on_x_array (x, fast=False)
+        y_scalar = [bez.eval_y_on_x (xi, fast=False) for xi in x]
+        assert np.allclose (y, y_scalar, rtol=0.0, atol=1e-12)
+
+
+    def test_bezier_forward_diff (self): 
+
+        py = [0, 0.1, 0.12, 0.05, -0.02, 0]
+
+        # cubic - forward differencing, higher degree - eval 
+        for px in ([0, 0.2, 0.7, 1], [0, 0, 0.1, 0.4, 0.8, 1]): 
+            for nPoints in (10, 100, 1000, 5000): 
+
+                x, y = Bezier (px, py[:len(px)]).forward_diff (nPoints)
+                x_eval, y_eval = Bezier (px, py[:len(px)]).eval (np.linspace (0.0, 1.0, nPoints))
+
+                # accumulated error of differencing must stay far below airfoil precision
+                assert np.allclose (x, x_eval, rtol=0.0, atol=1e-12)
+                assert np.allclose (y, y_eval, rtol=0.0, atol=1e-12)
+                assert x[-1] == px[-1]
+
+
+    def test_bezier_eval_closed_form (self): 
+
+        def bernstein (pxy, u, der):
+            # general form - sum of Bernstein polynomials of the derivative weights
+            weights = np.asarray (pxy, dtype=float)
+            for _ in range (der):
+                weights = np.ediff1d (weights) * (len(weights) - 1)
+            n = len(weights) - 1
+            return sum (basisFunction (n, i, u) * weights[i] for i in range (n+1))
+
+        u = np.linspace (0.0, 1.0, 21)
+        py = [0, 0.1, 0.15, 0.05, 0]
+
+        # quadratic, cubic and quartic - their derivatives hit the closed form of degree 3 and 2 
+        for px in ([0, 0.5, 1], [0, 0, 0.3, 1], [0, 0, 0.2, 0.6, 1]): 
+            bez = Bezier (px, py[:len(px)])
+            for der in (0, 1, 2):
+                x, y = bez.eval (u, der=der)
+                assert np.allclose (x, bernstein (px, u, der), rtol=0.0, atol=1e-13)
+                assert np.allclose (y, bernstein (py[:len(px)], u, der), rtol=0.0, atol=1e-13)
+                assert np.isclose (bez.eval_y (0.3, der=der), bernstein (py[:len(px)], 0.3, der), 
+                                   rtol=0.0, atol=1e-13)
+
+
 # Main program for testing 
 if __name__ == "__main__":
 
     test = Test_Spline()
     test.test_spline_1D()
     test.test_spline_2D()
+
+    test = Test_Bezier()
+    test.test_bezier_y_on_x_array()
+    test.test_bezier_forward_diff()
+    test.test_bezier_eval_closed_form()
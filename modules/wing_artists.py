@@ -6,6 +6,7 @@
 The "Artists" to plot a wing object on a matplotlib axes
 
 """
+import math
 import numpy as np
 
 from common_utils import *
@@ -568,7 +569,7 @@ class Planform_Artist (Artist):
         xl, yl = self.planform.hingeLine()
         dx = xl[1] - xl[0]
         dy = y1    - yl[0]
-        angle = np.arctan (dy/dx) * 180 / np.pi
+        angle = math.degrees (math.atan (dy/dx))
         self.planform.wing.set_hingeAngle (angle)  
  
         # update planform outline  
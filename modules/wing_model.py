@@ -21,6 +21,7 @@
 
 import os
 import numpy as np
+import math
 from math import  sin
 import bisect
 import json
@@ -992,6 +993,9 @@ class Planform_Bezier(Planform):
 
     wingSection_eitherPosOrChord = True
 
+    # number of (uniform) u points along the Bezier lines
+    nPoints_u = 100
+
 
     def __init__(self, myWing: Wing, dataDict: dict = None):
         super().__init__(myWing, dataDict)
@@ -1059,15 +1063,15 @@ class Planform_Bezier(Planform):
         # watch the different coordinate system 
         dx = self._py[1] - self._py[0]
         dy = self._px[1] - self._px[0]
-        return np.arctan (dy/dx) * 180 / np.pi
+        return math.degrees (math.atan (dy/dx))
     def set_tangentAngle_root (self, anAngle : float):
         """ set angle in degrees of the bezier tangent at root.
             ! The angle may not become negative as chord value won't be unique! """
         # watch the different coordinate system 
         anAngle = min (anAngle, 0.0)
         hypo = self.tangentLength_root
-        dy = hypo * np.sin (anAngle * np.pi / 180.0)
-        dx = hypo * np.cos (anAngle * np.pi / 180.0)
+        dy = hypo * math.sin (anAngle * math.pi / 180.0)
+        dx = hypo * math.cos (anAngle * math.pi / 180.0)
         self.set_p1x (self._px[0] + dy)
         self.set_p1y (self._py[0] + dx)
         
@@ -1078,8 +1082,8 @@ class Planform_Bezier(Planform):
         return (dx**2 + dy**2)**0.5
     def set_tangentLength_root (self, aLength):
         angle = self.tangentAngle_root
-        dy = aLength * np.sin (angle * np.pi / 180.0)
-        dx = aLength * np.cos (angle * np.pi / 180.0)
+        dy = aLength * math.sin (angle * math.pi / 180.0)
+        dx = aLength * math.cos (angle * math.pi / 180.0)
         self.set_p1x (self._px[0] + dy)
         self.set_p1y (self._py[0] + dx)
 
@@ -1112,7 +1116,7 @@ class Planform_Bezier(Planform):
         return (dx**2 + dy**2)**0.5
     def set_tangentLength_tip (self, aLength):
         angle = self.tangentAngle_tip
-        dy = aLength * np.sin (angle * np.pi / 180.0)
+        dy = aLength * math.sin (angle * math.pi / 180.0)
         self.set_p2x (self._px[3] + dy)
 
 
@@ -1161,8 +1165,8 @@ class Planform_Bezier(Planform):
 
 
     def _norm_u_points (self):
-        """ array of u (arc) points along the chord line  """
-        return np.linspace(0.0, 1.0, num=100) 
+        """ array of uniform u (arc) points along the chord line  """
+        return np.linspace(0.0, 1.0, num=self.nPoints_u) 
 
 
     def norm_chord_line (self):
@@ -1176,7 +1180,8 @@ class Planform_Bezier(Planform):
         # overloaded  - Bezier needs arc points u not y coordinates 
         #
 
-        y, chord = self._bezier.eval (self._norm_u_points() )
+        # forward differencing evaluates at uniform u - the same u as _norm_u_points 
+        y, chord = self._bezier.forward_diff (self.nPoints_u)
         return y, chord
 
     def norm_chord_function (self, y_norm, fast=True):
@@ -2039,7 +2044,7 @@ class Planform_DXF(Planform):
 
         # add hinge line angle 
         if self.adaptHingeAngle:
-            deltaHinge = np.tan((self.hingeAngle/180) * np.pi) * y_norm * self.halfwingspan
+            deltaHinge = math.tan((self.hingeAngle/180) * math.pi) * y_norm * self.halfwingspan
             le += deltaHinge 
             te += deltaHinge
 
@@ -2058,13 +2063,14 @@ class Planform_DXF(Planform):
         npoints = len(self.hingeLine_norm_dxf)
         y       = np.empty (npoints)
         hinge   = np.empty (npoints)
+        tanHinge = math.tan((self.hingeAngle/180) * math.pi)
         for i in range(npoints): 
             y[i]     = self.hingeLine_norm_dxf[i][0] * self.halfwingspan
             hinge[i] = self.hingeLine_norm_dxf[i][1] * self.rootchord
 
             # add hinge line angle to show original
             if self.adaptHingeAngle:
-                deltaHinge = np.tan((self.hingeAngle/180) * np.pi) * y[i]
+                deltaHinge = tanHinge * y[i]
                 hinge[i] += deltaHinge 
         
         return y , hinge 